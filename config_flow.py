@@ -91,17 +91,16 @@ class HyenaEBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         # Scan for devices
-        current_addresses = self._async_current_ids()
-        devices = bluetooth.async_discovered_service_info(self.hass)
-
-        # Filter for Hyena E-Bike devices
-        for device in devices:
-            if (
-                device.name
-                and device.name.startswith(DEVICE_NAME)
-                and device.address not in current_addresses
-            ):
-                self._discovered_devices[device.address] = device
+        current_addresses = set(self._async_current_ids())
+
+        # Filter for Hyena E-Bike devices in a single pass
+        self._discovered_devices = {
+            device.address: device
+            for device in bluetooth.async_discovered_service_info(self.hass)
+            if device.name
+            and device.name.startswith(DEVICE_NAME)
+            and device.address not in current_addresses
+        }
 
         if not self._discovered_devices:
             # No devices found, show manual entry form
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import struct
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -17,12 +17,15 @@ from bleak_retry_connector import (
 
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
     FRAME_DELIMITER,
     MAIN_CHARACTERISTIC_UUID,
+    MANUFACTURER,
+    MODEL,
     PACKET_ID_BATTERY_SOC,
     PACKET_ID_TEMPERATURE,
     SENSOR_BATTERY,
@@ -34,6 +37,26 @@ _LOGGER = logging.getLogger(__name__)
 # Connection timeout and retry settings
 CONNECTION_TIMEOUT = 30
 DISCONNECT_DELAY = 120  # Disconnect after 2 minutes of no updates
+RECONNECT_BACKOFF_MIN = 1.0  # Initial delay before reconnecting after a drop
+RECONNECT_BACKOFF_MAX = 60.0  # Upper bound for the doubling reconnect delay
+RECONNECT_STABLE_TIME = 60  # Uptime after which a connection counts as stable
+
+# First byte of the frame delimiter, checked before the full comparison
+_FRAME_DELIMITER_FIRST = FRAME_DELIMITER[0]
+
+# Payload parsers keyed by packet ID; each returns None if the payload is too short
+_PARSERS: dict[int, Callable[[bytes], Any]] = {
+    # Battery SOC (1 byte, percentage 0-100)
+    PACKET_ID_BATTERY_SOC: lambda d: d[0] if d else None,
+    # Temperature (2 bytes, big-endian, divide by 10 for °C)
+    PACKET_ID_TEMPERATURE: lambda d: ((d[0] << 8) | d[1]) if len(d) >= 2 else None,
+}
+
+# Sensor key and value conversion for each parsed packet ID
+_HANDLERS: dict[int, tuple[str, Callable[[Any], Any]]] = {
+    PACKET_ID_BATTERY_SOC: (SENSOR_BATTERY, lambda v: v),
+    PACKET_ID_TEMPERATURE: (SENSOR_TEMPERATURE, lambda v: v / 10.0),
+}
 
 
 class HyenaEBikeCoordinator(DataUpdateCoordinator):
@@ -54,8 +77,22 @@ class HyenaEBikeCoordinator(DataUpdateCoordinator):
         self.device_address = device_address
         self._client: BleakClientWithServiceCache | None = None
         self._connection_lock = asyncio.Lock()
-        self._disconnect_task: asyncio.Task | None = None
+        self._disconnect_handle: asyncio.TimerHandle | None = None
+        self._update_handle: asyncio.Handle | None = None
+        self._reconnect_handle: asyncio.TimerHandle | None = None
+        self._reconnect_backoff = RECONNECT_BACKOFF_MIN
+        self._connected_at: float | None = None
         self._expected_disconnect = False
+        self._shutting_down = False
+
+        # Shared by all sensor entities of this device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_address)},
+            name="Hyena E-Bike",
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+            connections={("bluetooth", device_address)},
+        )
 
         # Store telemetry data
         self.data: dict[str, Any] = {
@@ -114,6 +151,7 @@ class HyenaEBikeCoordinator(DataUpdateCoordinator):
                 )
 
                 _LOGGER.debug("Subscribed to telemetry notifications")
+                self._connected_at = self.hass.loop.time()
 
             except (BleakError, asyncio.TimeoutError) as ex:
                 _LOGGER.warning("Failed to connect to Hyena E-Bike: %s", ex)
@@ -129,107 +167,127 @@ class HyenaEBikeCoordinator(DataUpdateCoordinator):
         _LOGGER.warning("Unexpected disconnection from Hyena E-Bike")
         self._client = None
 
-        # Schedule reconnection attempt
-        self.hass.async_create_task(self._async_update_data())
+        # Only a connection that stayed up for a while resets the backoff,
+        # so a flapping link keeps doubling the reconnect delay
+        if (
+            self._connected_at is not None
+            and self.hass.loop.time() - self._connected_at >= RECONNECT_STABLE_TIME
+        ):
+            self._reconnect_backoff = RECONNECT_BACKOFF_MIN
+        self._connected_at = None
+
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        """Schedule a single reconnection attempt after the backoff delay."""
+        if self._reconnect_handle or self._shutting_down:
+            return
+
+        _LOGGER.debug("Reconnecting in %.0f seconds", self._reconnect_backoff)
+        self._reconnect_handle = self.hass.loop.call_later(
+            self._reconnect_backoff, self._reconnect_after_delay
+        )
+        self._reconnect_backoff = min(
+            self._reconnect_backoff * 2, RECONNECT_BACKOFF_MAX
+        )
+
+    @callback
+    def _reconnect_after_delay(self) -> None:
+        """Start a reconnection attempt once the backoff delay has elapsed."""
+        self._reconnect_handle = None
+        self.hass.async_create_task(self._async_reconnect())
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect to the device after an unexpected disconnection."""
+        try:
+            await self._ensure_connection()
+        except UpdateFailed as ex:
+            _LOGGER.debug("Reconnection to Hyena E-Bike failed: %s", ex)
+            self._schedule_reconnect()
 
     def _notification_handler(
         self, characteristic: BleakGATTCharacteristic, data: bytes
     ) -> None:
         """Handle incoming BLE notifications."""
-        # Ignore frame delimiters
-        if data == FRAME_DELIMITER:
+        # Ignore frame delimiters (cheap first-byte check before full compare)
+        if data and data[0] == _FRAME_DELIMITER_FIRST and data == FRAME_DELIMITER:
             return
 
         # Parse the packet
         packet_info = self._parse_packet(data)
-        if not packet_info:
+        if packet_info is None:
             return
 
         # Update data based on packet type
-        packet_id = packet_info["packet_id"]
-        parsed_value = packet_info.get("parsed_value")
-
+        packet_id, parsed_value = packet_info
         if parsed_value is None:
             return
 
-        updated = False
-
-        if packet_id == PACKET_ID_BATTERY_SOC:
-            # Battery SOC percentage (0-100)
-            self.data[SENSOR_BATTERY] = parsed_value
-            updated = True
-            _LOGGER.debug("Battery SOC: %s%%", parsed_value)
+        handler = _HANDLERS.get(packet_id)
+        if handler is None:
+            return
 
-        elif packet_id == PACKET_ID_TEMPERATURE:
-            # Temperature in °C (divide raw value by 10)
-            temperature_celsius = parsed_value / 10.0
-            self.data[SENSOR_TEMPERATURE] = temperature_celsius
-            updated = True
-            _LOGGER.debug("Temperature: %.1f°C", temperature_celsius)
+        sensor_key, transform = handler
+        value = transform(parsed_value)
+
+        # Only notify listeners when the value actually changed (or a failed
+        # poll needs clearing); updates in the same loop iteration are coalesced
+        if value != self.data[sensor_key] or not self.last_update_success:
+            self.data[sensor_key] = value
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: %s", sensor_key, value)
+            if self._update_handle is None:
+                self._update_handle = self.hass.loop.call_soon(
+                    self._async_publish_update
+                )
 
-        # Notify listeners if data was updated
-        if updated:
-            self.async_set_updated_data(self.data)
+        # Reset disconnect timer on activity
+        self._reset_disconnect_timer()
 
-            # Reset disconnect timer on activity
-            self._reset_disconnect_timer()
+    @callback
+    def _async_publish_update(self) -> None:
+        """Push pending telemetry changes to listeners."""
+        self._update_handle = None
+        self.async_set_updated_data(self.data)
 
-    def _parse_packet(self, data: bytes) -> dict[str, Any] | None:
+    def _parse_packet(self, data: bytes) -> tuple[int, Any] | None:
         """Parse incoming telemetry packet according to protocol.
 
         Adapted from the original Python monitoring script.
+        Returns a (packet_id, parsed_value) tuple, or None for packets we
+        don't handle.
         """
         if len(data) < 2:
             return None
 
         packet_id = data[0]
-        packet_data = data[1:]
-
-        packet_info = {
-            "packet_id": packet_id,
-            "raw_data": data.hex(),
-            "parsed_value": None,
-        }
-
-        try:
-            # Battery SOC (1 byte, percentage 0-100)
-            if packet_id == PACKET_ID_BATTERY_SOC and len(packet_data) >= 1:
-                packet_info["parsed_value"] = packet_data[0]
 
-            # Temperature (2 bytes, big-endian, divide by 10 for °C)
-            elif packet_id == PACKET_ID_TEMPERATURE and len(packet_data) >= 2:
-                temp_raw = struct.unpack(">H", packet_data[:2])[0]
-                packet_info["parsed_value"] = temp_raw
-
-            # Other packet types we don't care about yet
-            else:
-                return None
-
-        except struct.error as ex:
-            _LOGGER.debug("Failed to parse packet: %s", ex)
+        # Other packet types we don't care about yet
+        parser = _PARSERS.get(packet_id)
+        if parser is None:
             return None
 
-        return packet_info
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Raw packet: %s", data.hex())
+
+        return packet_id, parser(data[1:])
 
     def _reset_disconnect_timer(self) -> None:
         """Reset the disconnect timer."""
-        if self._disconnect_task:
-            self._disconnect_task.cancel()
-            self._disconnect_task = None
+        if self._disconnect_handle:
+            self._disconnect_handle.cancel()
 
         # Schedule disconnect after period of inactivity
         # This helps save BLE connection slots on the proxy
-        self._disconnect_task = self.hass.async_create_task(
-            self._disconnect_after_delay()
+        self._disconnect_handle = self.hass.loop.call_later(
+            DISCONNECT_DELAY, self._disconnect_after_delay
         )
 
-    async def _disconnect_after_delay(self) -> None:
+    @callback
+    def _disconnect_after_delay(self) -> None:
         """Disconnect from device after delay to save connection slots."""
-        try:
-            await asyncio.sleep(DISCONNECT_DELAY)
-            await self._async_disconnect()
-        except asyncio.CancelledError:
-            pass
+        self._disconnect_handle = None
+        self.hass.async_create_task(self._async_disconnect())
 
     async def _async_disconnect(self) -> None:
         """Disconnect from the device."""
@@ -247,12 +305,23 @@ class HyenaEBikeCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Error during disconnect: %s", ex)
             finally:
                 self._client = None
+                self._connected_at = None
                 self._expected_disconnect = False
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator and disconnect."""
-        if self._disconnect_task:
-            self._disconnect_task.cancel()
-            self._disconnect_task = None
+        self._shutting_down = True
+
+        if self._reconnect_handle:
+            self._reconnect_handle.cancel()
+            self._reconnect_handle = None
+
+        if self._update_handle:
+            self._update_handle.cancel()
+            self._update_handle = None
+
+        if self._disconnect_handle:
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
 
         await self._async_disconnect()
@@ -15,15 +15,13 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_DEVICE_ADDRESS,
     DOMAIN,
-    MANUFACTURER,
-    MODEL,
     SENSOR_BATTERY,
     SENSOR_TEMPERATURE,
 )
@@ -31,6 +29,20 @@ from .coordinator import HyenaEBikeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Battery icons indexed by level // 10, clamped to 0-9
+_BATTERY_ICONS = (
+    "mdi:battery-10",
+    "mdi:battery-20",
+    "mdi:battery-30",
+    "mdi:battery-40",
+    "mdi:battery-50",
+    "mdi:battery-60",
+    "mdi:battery-70",
+    "mdi:battery-80",
+    "mdi:battery-90",
+    "mdi:battery",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -61,13 +73,7 @@ class HyenaEBikeSensorBase(CoordinatorEntity[HyenaEBikeCoordinator], SensorEntit
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.device_address)},
-            name="Hyena E-Bike",
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            connections={("bluetooth", coordinator.device_address)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -91,11 +97,13 @@ class HyenaBatterySensor(HyenaEBikeSensorBase):
         """Initialize the battery sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.device_address}_{SENSOR_BATTERY}"
+        self._attr_native_value = coordinator.data[SENSOR_BATTERY]
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get(SENSOR_BATTERY)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the latest value from the coordinator."""
+        self._attr_native_value = self.coordinator.data[SENSOR_BATTERY]
+        super()._handle_coordinator_update()
 
     @property
     def icon(self) -> str:
@@ -103,25 +111,7 @@ class HyenaBatterySensor(HyenaEBikeSensorBase):
         battery_level = self.native_value
         if battery_level is None:
             return "mdi:battery-unknown"
-        if battery_level >= 90:
-            return "mdi:battery"
-        if battery_level >= 80:
-            return "mdi:battery-90"
-        if battery_level >= 70:
-            return "mdi:battery-80"
-        if battery_level >= 60:
-            return "mdi:battery-70"
-        if battery_level >= 50:
-            return "mdi:battery-60"
-        if battery_level >= 40:
-            return "mdi:battery-50"
-        if battery_level >= 30:
-            return "mdi:battery-40"
-        if battery_level >= 20:
-            return "mdi:battery-30"
-        if battery_level >= 10:
-            return "mdi:battery-20"
-        return "mdi:battery-10"
+        return _BATTERY_ICONS[min(max(battery_level // 10, 0), 9)]
 
 
 class HyenaTemperatureSensor(HyenaEBikeSensorBase):
@@ -141,8 +131,10 @@ class HyenaTemperatureSensor(HyenaEBikeSensorBase):
         """Initialize the temperature sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.device_address}_{SENSOR_TEMPERATURE}"
+        self._attr_native_value = coordinator.data[SENSOR_TEMPERATURE]
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get(SENSOR_TEMPERATURE)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the latest value from the coordinator."""
+        self._attr_native_value = self.coordinator.data[SENSOR_TEMPERATURE]
+        super()._handle_coordinator_update()